@@ -2,30 +2,48 @@
 Robust DownloadManager for CVM monthly files.
 
 Features:
-- streaming download with chunked writes and .part temporary file
+- streaming download with chunked writes and .part temporary file (raw urllib3
+  response copied straight to disk), preallocated
+  with posix_fallocate when the size is known so the ZIP lands in contiguous extents
 - automatic monthly -> annual fallback (tries monthly first, then annual on 404)
-- exponential backoff for transient errors (doesn't retry 404)
+- annual ZIPs fetched as parallel HTTP Range requests written in place with os.pwrite
+- transient errors (connection failures, 5xx, Retry-After) retried inside urllib3 with
+  capped exponential backoff and jitter; bodies cut off mid-transfer or failing
+  validation are re-downloaded with the same backoff; 4xx are never retried
 - minimal file-size sanity check
-- zip integrity check (zip.testzip)
+- zip integrity check: full CRC pass (zip.testzip) after a download, recorded in a
+  `<name>.ok` marker holding the file's size and mtime; cached files whose marker
+  no longer matches only get a central-directory parse
 - atomic rename after successful download
 - optional forced re-download and re-validation of existing files
-- parallel downloads with ThreadPoolExecutor and a lightweight throttle to avoid CVM rate limits
+- revalidation of cached files against the server: ETag/Last-Modified kept in a
+  `<name>.meta.json` sidecar, checked with HEAD and conditional GET (304 = keep)
+- parallel downloads with ThreadPoolExecutor and a shared sliding-window rate limit
+  (requests/second across all workers) to avoid CVM rate limits
+- persistent keep-alive connection pools shared by all workers (one handshake per connection, not per month)
 - safe directory creation and helpful logging
 
 Drop this file into your project and adapt settings/constants imports if needed.
 """
 from __future__ import annotations
 
+import json
 import logging
+import os
+import random
+import shutil
+import threading
 import time
 import zipfile
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-import requests
+import urllib3
+from urllib3.util.retry import Retry
 
 try:
     # project-specific settings; if not available, sensible defaults will be used
@@ -49,6 +67,48 @@ except Exception:  # pragma: no cover - fallback defaults for standalone use
 
 logger = logging.getLogger(__name__)
 
+# Statuses urllib3 retries (with backoff, honouring Retry-After) before giving up
+RETRY_HTTP_STATUSES = (500, 502, 503, 504)
+
+
+class HTTPStatusError(Exception):
+    """Raised when a download request returns an HTTP error status (>= 400)."""
+
+    def __init__(self, url: str, status_code: int):
+        self.url = url
+        self.status_code = status_code
+        super().__init__(f"HTTP {status_code} for {url}")
+
+
+class _RangeNotSupported(Exception):
+    """The server answered a byte-range request with the full body."""
+
+
+class _RateLimiter:
+    """Sliding-window rate limiter shared by all download workers.
+
+    Keeps a log of recent request start times; at most `rate * period`
+    requests start in any `period`-second window, and `acquire` only sleeps
+    when the window is already full.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = max(1, int(rate * period))
+        self.period = period
+        self._sent: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0] >= self.period:
+                self._sent.popleft()
+            if len(self._sent) >= self.capacity:
+                # holding the lock while waiting keeps the other workers queued in order
+                time.sleep(self.period - (now - self._sent.popleft()))
+                now = time.monotonic()
+            self._sent.append(now)
+
 
 @dataclass
 class DownloadManager:
@@ -59,11 +119,41 @@ class DownloadManager:
     max_workers: int = settings.MAX_WORKERS
     min_download_bytes: int = getattr(settings, "MIN_DOWNLOAD_BYTES", 50 * 1024)
     user_agent: str = "CVM-Downloader/1.0 (+https://example.com)"
-    throttle_seconds: float = 0.1  # small pause between requests to be polite
+    requests_per_second: float = 10.0  # polite request rate shared by all workers
+    max_backoff_seconds: float = 30.0  # ceiling for the exponential retry delay
+    backoff_jitter: float = 0.5  # up to 0.5 s random extra delay so parallel workers don't retry in lockstep
+    stream_chunk_size: int = 128 * 1024  # bytes read per iteration of the streaming loop
+    write_buffer_size: int = 1 << 20  # 1 MB userspace buffer in front of the .part file
+    range_parts: int = 8  # parallel byte-range requests used for the large annual ZIPs
+    revalidate: bool = True  # HEAD cached files and re-download them when the server copy changed
 
     def __post_init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.user_agent})
+        headers = {"User-Agent": self.user_agent, "Connection": "keep-alive"}
+        # Enough connections for every worker plus a full set of range parts; block
+        # instead of opening throwaway connections when the pool is exhausted
+        pool_maxsize = max(self.max_workers * 2, self.range_parts)
+        # Exhausted retries hand back the last response so callers still see the
+        # real status code
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=1.0,
+            backoff_jitter=self.backoff_jitter,
+            backoff_max=self.max_backoff_seconds,
+            status_forcelist=RETRY_HTTP_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+        # Every GET/HEAD (ZIP bodies, range parts, revalidation) goes through this pool
+        self.pool = urllib3.PoolManager(
+            num_pools=self.max_workers,
+            maxsize=pool_maxsize,
+            block=True,
+            headers=headers,
+            retries=retry,
+        )
+        self._limiter = _RateLimiter(self.requests_per_second)
         # Ensure directories exist
         self.raw_dir = Path(self.raw_dir)
         self.raw_unzip_dir = Path(self.raw_unzip_dir)
@@ -84,25 +174,185 @@ class DownloadManager:
         return self.raw_dir / filename
 
     # -------------------------- download primitives -------------------------
-    def _stream_download(self, url: str, local_path: Path) -> None:
-        """Stream download to a temporary .part file then atomically rename."""
+    def _request(self, method: str, url: str, **kwargs) -> urllib3.BaseHTTPResponse:
+        """pool.request behind the shared rate limiter."""
+        self._limiter.acquire()
+        return self.pool.request(method, url, timeout=self.timeout, **kwargs)
+
+    def _request_headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        # per-request headers replace the pool defaults in urllib3, so merge them
+        return {**self.pool.headers, **(extra or {})}
+
+    def _stream_download(self, url: str, local_path: Path,
+                         headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        """Stream download to a temporary .part file then atomically rename.
+
+        Returns the response's cache validators, or None on 304 Not Modified
+        (nothing is written in that case).
+        """
         tmp_path = local_path.with_suffix(local_path.suffix + ".part")
 
         # Ensure parent exists
         tmp_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with self.session.get(url, stream=True, timeout=self.timeout) as r:
-            r.raise_for_status()
-            with open(tmp_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=1024 * 1024):  # 1 MB
-                    if chunk:
-                        f.write(chunk)
+        r = self._request("GET", url, headers=self._request_headers(headers), preload_content=False)
+        try:
+            if r.status == 304:
+                return None
+            if r.status >= 400:
+                raise HTTPStatusError(url, r.status)
+            validators = self._validators(r.headers)
+            # Content-Length is the on-disk size unless urllib3 is decoding the body
+            length = 0 if r.headers.get("Content-Encoding") else int(r.headers.get("Content-Length") or 0)
+            with open(tmp_path, "wb", buffering=self.write_buffer_size) as f:
+                self._preallocate(f.fileno(), length)
+                shutil.copyfileobj(r, f, length=self.stream_chunk_size)
+                # drop any preallocated tail the body did not fill
+                f.truncate()
+        finally:
+            r.release_conn()
         # atomic rename
         tmp_path.replace(local_path)
+        return validators
+
+    def _ranged_download(self, url: str, local_path: Path, parts: Optional[int] = None,
+                         headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+        """Download `url` as `parts` parallel byte-range requests, then atomically rename.
+
+        Each worker writes its slice straight into a preallocated .part file with
+        os.pwrite. Falls back to _stream_download when the server does not advertise
+        byte ranges, or answers a range request with a plain 200.
+        Returns the cache validators, or None on 304 Not Modified.
+        """
+        parts = parts or self.range_parts
+        head = self._request("HEAD", url, headers=self._request_headers(headers))
+        if head.status == 304:
+            return None
+        if head.status >= 400:
+            raise HTTPStatusError(url, head.status)
+
+        length = int(head.headers.get("Content-Length") or 0)
+        accepts_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+        if parts < 2 or not accepts_ranges or length < parts * self.stream_chunk_size or not hasattr(os, "pwrite"):
+            return self._stream_download(url, local_path, headers=headers)
+
+        tmp_path = local_path.with_suffix(local_path.suffix + ".part")
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+
+        step = -(-length // parts)  # ceil division
+        ranges = [(start, min(start + step, length) - 1) for start in range(0, length, step)]
+
+        fd = os.open(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            self._preallocate(fd, length)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                # list() re-raises the first worker error
+                list(executor.map(lambda rng: self._fetch_range(url, fd, *rng), ranges))
+        except _RangeNotSupported:
+            logger.debug(f"Server ignored Range header for {url}; falling back to a single stream")
+            ranged = False
+        else:
+            ranged = True
+        finally:
+            os.close(fd)
+
+        if not ranged:
+            return self._stream_download(url, local_path, headers=headers)
+        # atomic rename
+        tmp_path.replace(local_path)
+        return self._validators(head.headers)
+
+    @staticmethod
+    def _preallocate(fd: int, length: int) -> None:
+        """Reserve `length` bytes for `fd` up front so the filesystem can allocate contiguous extents.
+
+        Falls back to a sparse ftruncate where posix_fallocate is unavailable or
+        unsupported by the filesystem.
+        """
+        if length <= 0:
+            return
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, length)
+                return
+            except OSError as e:
+                logger.debug(f"posix_fallocate unavailable ({e}); using ftruncate")
+        os.ftruncate(fd, length)
+
+    def _fetch_range(self, url: str, fd: int, start: int, end: int) -> None:
+        """Fetch bytes [start, end] of `url` and write them at the same offset of `fd`."""
+        headers = self._request_headers({"Range": f"bytes={start}-{end}"})
+        r = self._request("GET", url, headers=headers, preload_content=False)
+        try:
+            if r.status == 200:
+                raise _RangeNotSupported(url)
+            if r.status >= 400:
+                raise HTTPStatusError(url, r.status)
+            offset = start
+            for chunk in r.stream(self.stream_chunk_size):
+                view = memoryview(chunk)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    offset += written
+                    view = view[written:]
+        finally:
+            r.release_conn()
+
+        if offset != end + 1:
+            raise ValueError(f"Short read for bytes {start}-{end} of {url}: got {offset - start} bytes")
+
+    @staticmethod
+    def _marker_path(local_path: Path) -> Path:
+        """Sidecar written once `local_path` has passed _deep_validate."""
+        return local_path.with_name(local_path.name + ".ok")
+
+    @staticmethod
+    def _file_stat(local_path: Path) -> Optional[Tuple[int, int]]:
+        """(size, mtime_ns) of `local_path`, or None if it does not exist."""
+        try:
+            st = local_path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def _write_marker(self, local_path: Path) -> None:
+        """Record the size and mtime of the file that just passed _deep_validate."""
+        size, mtime_ns = self._file_stat(local_path)
+        with open(self._marker_path(local_path), "w") as f:
+            json.dump({"size": size, "mtime_ns": mtime_ns}, f)
+
+    def _marker_matches(self, local_path: Path, stat: Tuple[int, int]) -> bool:
+        """True if the .ok marker was written for a file with exactly this (size, mtime_ns)."""
+        try:
+            with open(self._marker_path(local_path), "r") as f:
+                recorded = json.load(f)
+            return (recorded["size"], recorded["mtime_ns"]) == tuple(stat)
+        except (OSError, ValueError, KeyError, TypeError):
+            # missing, empty (older runs) or unreadable markers vouch for nothing
+            return False
 
-    def _validate_file(self, local_path: Path) -> None:
-        """Run basic sanity checks: size and zip integrity.
+    def _quick_validate(self, local_path: Path, size: Optional[int] = None) -> None:
+        """Cheap checks for cached files: size and a parse of the ZIP central directory.
 
+        Raises ValueError if validation fails.
+        """
+        size = local_path.stat().st_size if size is None else size
+        if size < self.min_download_bytes:
+            raise ValueError(f"Downloaded file too small: {size} bytes")
+
+        # infolist() only reads the central directory; a truncated/corrupt EOCD raises BadZipFile
+        try:
+            with zipfile.ZipFile(local_path, "r") as zf:
+                if not zf.infolist():
+                    raise ValueError("Empty ZIP archive")
+        except zipfile.BadZipFile:
+            raise ValueError("BadZipFile: not a ZIP archive or corrupted")
+
+    def _deep_validate(self, local_path: Path) -> None:
+        """Run full sanity checks: size and CRC of every ZIP member.
+
+        Writes the .ok marker (size and mtime of the validated file) on success so
+        later runs can skip validation while the file is unchanged.
         Raises ValueError if validation fails.
         """
         size = local_path.stat().st_size
@@ -118,17 +368,95 @@ class DownloadManager:
         except zipfile.BadZipFile:
             raise ValueError("BadZipFile: not a ZIP archive or corrupted")
 
+        self._write_marker(local_path)
+
+    # -------------------------- revalidation helpers ------------------------
+    @staticmethod
+    def _meta_path(local_path: Path) -> Path:
+        """JSON sidecar holding the source URL and cache validators of `local_path`."""
+        return local_path.with_name(local_path.name + ".meta.json")
+
+    @staticmethod
+    def _validators(headers) -> Dict[str, str]:
+        pairs = (("etag", "ETag"), ("last_modified", "Last-Modified"))
+        return {key: headers[name] for key, name in pairs if headers.get(name)}
+
+    def _load_meta(self, local_path: Path) -> Optional[Dict[str, str]]:
+        try:
+            with open(self._meta_path(local_path), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_meta(self, local_path: Path, url: str, validators: Dict[str, str]) -> None:
+        meta_path = self._meta_path(local_path)
+        if not validators:
+            meta_path.unlink(missing_ok=True)
+            return
+        with open(meta_path, "w") as f:
+            json.dump({"url": url, **validators}, f, indent=2)
+
+    @staticmethod
+    def _conditional_headers(meta: Dict[str, str]) -> Dict[str, str]:
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _is_unchanged(self, meta: Dict[str, str]) -> bool:
+        """HEAD the URL a cached file came from and compare validators with its sidecar."""
+        url = meta["url"]
+        head = self._request("HEAD", url)
+        if head.status >= 400:
+            raise HTTPStatusError(url, head.status)
+        current = self._validators(head.headers)
+        stored = {key: meta[key] for key in ("etag", "last_modified") if key in meta}
+        return bool(current) and current == stored
+
+    @staticmethod
+    def _extract_members(zip_path: Path, names: List[str], target_dir: Path) -> None:
+        """Extract `names` through a private ZipFile handle (handles can't be shared across threads)."""
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            for name in names:
+                zf.extract(name, target_dir)
+
     def extract_zip(self, zip_path: Path, dest_dir: Optional[Path] = None, delete_zip_after: bool = False) -> bool:
+        """Extract `zip_path` into `<dest_dir>/<zip_stem>/`.
+
+        Multi-member archives (annual ZIPs) are extracted concurrently, one ZipFile
+        handle per worker, so decompression of different members overlaps.
+        """
         dest_dir = Path(dest_dir) if dest_dir is not None else self.raw_unzip_dir
         target_dir = dest_dir / zip_path.stem
         try:
             target_dir.mkdir(parents=True, exist_ok=True)
             with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(path=target_dir)
+                members = sorted(zf.infolist(), key=lambda info: info.file_size, reverse=True)
+                if len(members) <= 1:
+                    zf.extractall(path=target_dir)
+
+            if len(members) > 1:
+                # ZipFile.extract creates missing parents without exist_ok, so concurrent
+                # workers race on shared directories; create the whole tree up front
+                for info in members:
+                    parts = [p for p in info.filename.split("/") if p not in ("", ".", "..")]
+                    folder = target_dir.joinpath(*parts) if info.is_dir() else target_dir.joinpath(*parts[:-1])
+                    folder.mkdir(parents=True, exist_ok=True)
+                members = [info for info in members if not info.is_dir()]
+
+                workers = max(1, min(len(members), os.cpu_count() or 1))
+                # round-robin over members sorted by size keeps the workers' loads balanced
+                groups = [[info.filename for info in members[i::workers]] for i in range(workers)]
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(lambda names: self._extract_members(zip_path, names, target_dir), groups))
             logger.info(f"✓ Extracted {zip_path.name} -> {target_dir}")
             if delete_zip_after:
                 try:
                     zip_path.unlink()
+                    self._marker_path(zip_path).unlink(missing_ok=True)
+                    self._meta_path(zip_path).unlink(missing_ok=True)
                     logger.info(f"✓ Deleted zip file {zip_path.name}")
                 except Exception as e:
                     logger.warning(f"Failed to delete zip file {zip_path.name}: {e}")
@@ -141,58 +469,112 @@ class DownloadManager:
             return False
 
     # -------------------------- public API --------------------------
-    def download_single_month(self, year_month: datetime, force: bool = False) -> Optional[Path]:
+    def download_single_month(self, year_month: datetime, force: bool = False,
+                              existing: Optional[Dict[str, Optional[Tuple[int, int]]]] = None) -> Optional[Path]:
         """Download a single month with fallback annual URL on 404.
 
+        `existing` is an optional {filename: (size, mtime_ns)} snapshot of raw_dir
+        (see download_range); sidecar files map to None since only their presence
+        matters. When given it replaces the per-file stat() calls. A cached ZIP
+        skips validation only if its .ok marker records the same size and mtime.
+
         Returns Path on success, None on permanent failure (404 or final failure).
         """
         local_path = self.get_local_path(year_month)
-
-        # If file exists and we don't force, validate it and return if valid
-        if local_path.exists() and not force:
-            try:
-                self._validate_file(local_path)
-                logger.debug(f"File exists and valid: {local_path.name}")
-                return local_path
-            except Exception:
-                logger.warning(f"Existing file {local_path.name} failed validation; re-downloading")
+        marker = self._marker_path(local_path)
+        meta = None
+
+        # If file exists and we don't force, check it and return if valid
+        if not force:
+            if existing is not None:
+                stat = existing.get(local_path.name)
+                has_marker = marker.name in existing
+            else:
+                stat = self._file_stat(local_path)
+                has_marker = marker.exists()
+
+            verified = False
+            if has_marker:
+                if stat is not None and self._marker_matches(local_path, stat):
+                    verified = True
+                else:
+                    # The ZIP is gone or was replaced/truncated since it was validated
+                    # (e.g. by hand); a stale marker must not vouch for it
+                    marker.unlink(missing_ok=True)
+
+            valid = verified
+            if not verified and stat is not None:
+                try:
+                    self._quick_validate(local_path, stat[0])
+                    valid = True
+                except Exception:
+                    logger.warning(f"Existing file {local_path.name} failed validation; re-downloading")
+
+            if valid:
+                if self.revalidate and (existing is None or self._meta_path(local_path).name in existing):
+                    meta = self._load_meta(local_path)
+                if meta is None:
+                    logger.debug(f"File exists and valid: {local_path.name}")
+                    return local_path
+                try:
+                    if self._is_unchanged(meta):
+                        logger.debug(f"File exists and unchanged on server: {local_path.name}")
+                        return local_path
+                    logger.info(f"Server copy of {local_path.name} changed; re-downloading")
+                except (HTTPStatusError, urllib3.exceptions.HTTPError) as e:
+                    logger.warning(f"Could not revalidate {local_path.name}: {e}; keeping cached file")
+                    return local_path
 
         # Try monthly first, then annual on 404
-        candidates = [self.generate_monthly_url(year_month), self.generate_annual_url(year_month)]
+        annual_url = self.generate_annual_url(year_month)
+        candidates = [self.generate_monthly_url(year_month), annual_url]
 
         for url in candidates:
-            attempt = 0
-            while attempt < self.retries:
-                attempt += 1
+            for attempt in range(1, max(1, self.retries) + 1):
                 try:
+                    # connect errors and 5xx are retried by urllib3 (see Retry in __post_init__);
+                    # this loop covers failures while reading the body and failed validation
                     logger.info(f"Downloading {url} -> {local_path.name} (attempt {attempt}/{self.retries})")
-                    self._stream_download(url, local_path)
-                    # small throttle
-                    time.sleep(self.throttle_seconds)
+                    # conditional GET so an unchanged file costs a 304 and no body
+                    conditional = self._conditional_headers(meta) if meta and meta.get("url") == url else None
+                    if url == annual_url:
+                        validators = self._ranged_download(url, local_path, headers=conditional)
+                    else:
+                        validators = self._stream_download(url, local_path, headers=conditional)
+                    if validators is None:
+                        logger.info(f"Not modified (304): {local_path.name}")
+                        return local_path
+                    # The marker described the file we just replaced
+                    marker.unlink(missing_ok=True)
 
                     # validate
-                    self._validate_file(local_path)
+                    self._deep_validate(local_path)
+                    self._save_meta(local_path, url, validators)
                     logger.info(f"✓ Downloaded & validated {local_path.name}")
                     return local_path
 
-                except requests.exceptions.HTTPError as e:
-                    status = getattr(e.response, "status_code", None)
-                    if status == 404:
+                except HTTPStatusError as e:
+                    if e.status_code == 404:
                         logger.warning(f"Not found (404): {url}")
-                        # try next candidate (annual) instead of retrying the same URL
                         break
-                    logger.warning(f"HTTP error for {url}: {e}; retrying" )
-                except (requests.exceptions.RequestException, ValueError) as e:
-                    # ValueError raised by validation
+                    logger.warning(f"HTTP error for {url}: {e}")
+                except urllib3.exceptions.MaxRetryError as e:
+                    # urllib3 already spent the retry budget on this one
                     logger.warning(f"Error downloading {url}: {e}")
-
-                # Exponential backoff for transient errors (don't backoff on 404 since it's handled)
-                backoff = 2 ** attempt
-                logger.debug(f"Backing off for {backoff}s before retry")
-                time.sleep(backoff)
-
-            # end attempts for this candidate
-            logger.debug(f"Giving up on {url} after {self.retries} attempts, trying next candidate if any")
+                except (urllib3.exceptions.HTTPError, OSError, ValueError) as e:
+                    # truncated/reset bodies, read timeouts, short range reads; ValueError also from validation
+                    logger.warning(f"Error downloading {url}: {e}")
+                    if attempt < self.retries:
+                        # the local file may already be replaced, so never accept a 304 on a retry
+                        meta = None
+                        delay = min(2 ** attempt, self.max_backoff_seconds) + random.uniform(0, self.backoff_jitter)
+                        logger.debug(f"Backing off for {delay:.1f}s before retry")
+                        time.sleep(delay)
+                        continue
+
+                # only a 404 falls through to the annual file
+                logger.error(f"Failed to download file for {year_month.strftime('%Y-%m')}")
+                return None
 
         # If we get here, all attempts failed
         logger.error(f"Failed to download file for {year_month.strftime('%Y-%m')}")
@@ -214,9 +596,22 @@ class DownloadManager:
         logger.info(f"Downloading {len(months)} months with {max_workers} workers")
         downloaded: List[Path] = []
 
-        # Throttle control via simple sleep in worker; you can swap for a more advanced rate limiter
+        # One directory scan up front (ZIPs and their sidecars) instead of stat() calls per month;
+        # only ZIPs are stat()ed, so sidecars are recorded by name alone
+        existing: Dict[str, Optional[Tuple[int, int]]] = {}
+        with os.scandir(self.raw_dir) as it:
+            for e in it:
+                if not e.is_file():
+                    continue
+                if e.name.endswith(".zip"):
+                    st = e.stat()
+                    existing[e.name] = (st.st_size, st.st_mtime_ns)
+                elif e.name.endswith((".ok", ".meta.json")):
+                    existing[e.name] = None
+
+        # Requests are throttled inside _request by the shared self._limiter
         def worker(month: datetime) -> Optional[Path]:
-            return self.download_single_month(month, force=force)
+            return self.download_single_month(month, force=force, existing=existing)
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_month = {executor.submit(worker, m): m for m in months}
@@ -1,10 +1,13 @@
 import pandas as pd
 from src.utils.load_data import load_data_with_features
-from src.models.kmeans import KMeansTrainer
+from src.models.minibatch_kmeans import MiniBatchKMeansTrainer
 from src.pipelines.experiment_pipeline import run_all_experiments
 from src.process.pre_processing import PCA_scalling, scalling, PCA, just_filter
 from src.models.gmm import GMMTrainer
 
+# Derived frames (e.g. df.assign(pred=...)) share memory with their parent instead of copying it
+pd.set_option("mode.copy_on_write", True)
+
 
 def main():
     """
@@ -12,12 +15,12 @@ def main():
     """
     # 1. Define Experiment Configuration
     look_features = ['mean_return', 'median_return', 'std_return', 'avg_time_drawdown', 'sharpe', 'max_drawdown']
-    models = [KMeansTrainer, GMMTrainer]
+    models = [MiniBatchKMeansTrainer, GMMTrainer]
     clusters = [2, 3, 4, 5]
     pre_processing_flags = [just_filter, scalling, PCA, PCA_scalling]
 
     # 2. Load Data
-    df_train, df_test, df_val = load_data_with_features()
+    df_train, df_test, df_val = load_data_with_features(columns=look_features)
 
     # 3. Run Experiments
     results_df = run_all_experiments(df_train, df_test, df_val, models, clusters, pre_processing_flags, look_features)
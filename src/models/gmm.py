@@ -1,12 +1,14 @@
+import numpy as np
 from sklearn.mixture import GaussianMixture
 from .base import BaseTrainer
 
 class GMMTrainer(BaseTrainer):
-    def __init__(self, n_components=2, random_state=0, n_init=1, **kwargs):
+    def __init__(self, n_components=2, random_state=0, n_init=1, covariance_type="diag", **kwargs):
         self.params = dict(
             n_components=n_components,
             random_state=random_state,
-            n_init=n_init
+            n_init=n_init,
+            covariance_type=covariance_type
         )
         self.params.update(kwargs)
         self.model = None
@@ -21,7 +23,8 @@ class GMMTrainer(BaseTrainer):
         self.model = GaussianMixture(**self.params)
 
     def fit(self, X):
-        self.model.fit(X)
+        # GaussianMixture's default init_params="kmeans" already seeds EM from k-means
+        self.model.fit(np.asarray(X, dtype=np.float32))
 
     def predict(self, X):
-        return self.model.predict(X)
+        return self.model.predict(np.asarray(X, dtype=np.float32))
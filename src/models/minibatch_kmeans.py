@@ -0,0 +1,25 @@
+from sklearn.cluster import MiniBatchKMeans
+from .base import BaseTrainer
+
+class MiniBatchKMeansTrainer(BaseTrainer):
+    def __init__(self, n_clusters=2, random_state=0, batch_size=4096, n_init=3, max_iter=100):
+        self.params = dict(
+            n_clusters=n_clusters,
+            random_state=random_state,
+            batch_size=batch_size,
+            n_init=n_init,
+            max_iter=max_iter
+        )
+        self.model = None
+
+    def set_params(self, **kwargs):
+        self.params.update(kwargs)
+
+    def build(self):
+        self.model = MiniBatchKMeans(**self.params)
+
+    def fit(self, X):
+        self.model.fit(X)
+
+    def predict(self, X):
+        return self.model.predict(X)
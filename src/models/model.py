@@ -1,11 +1,19 @@
+import numpy as np
 import pandas as pd
-from sklearn.decomposition import PCA
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.decomposition import PCA, IncrementalPCA
 from sklearn.preprocessing import RobustScaler, MinMaxScaler
 from src.utils.custom_logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _as_float32(df: pd.DataFrame) -> np.ndarray:
+    """Numeric columns of `df` as a float32 matrix, so sklearn neither upcasts nor copies again."""
+    return df.select_dtypes(include=np.number).to_numpy(dtype=np.float32, copy=False)
+
+
 class PCAWrapper:
     """
     Wrapper for performing PCA consistently on train / test / validation sets.
@@ -28,38 +36,44 @@ class PCAWrapper:
         Fits PCA on train and transforms train, test and validation.
         Returns (train_pca, test_pca, val_pca)
 
+    Notes
+    -----
+    Features are converted once to float32 arrays; the returned DataFrames wrap
+    the float32 PCA output without copying.
     """
 
     def __init__(self, train_df: pd.DataFrame, test_df: pd.DataFrame, val_df: pd.DataFrame, **pca_kwargs):
-        self.train_df = train_df.copy()
-        self.test_df = test_df.copy()
-        self.val_df = val_df.copy()
-
         # Schema enforcement
         if not (list(train_df.columns) == list(test_df.columns) == list(val_df.columns)):
             raise ValueError("Train / Test / Val must have identical columns in the same order.")
 
         # Numeric validation
-        if not all(pd.api.types.is_numeric_dtype(self.train_df[col]) for col in self.train_df.columns):
+        if not all(pd.api.types.is_numeric_dtype(train_df[col]) for col in train_df.columns):
             raise ValueError("PCAWrapper only supports numeric features.")
 
-        if self.train_df.isnull().any().any():
+        self.train = _as_float32(train_df)
+        self.test = _as_float32(test_df)
+        self.val = _as_float32(val_df)
+        self.indexes = (train_df.index, test_df.index, val_df.index)
+
+        if np.isnan(self.train).any():
             raise ValueError("Training dataset contains NaN values. Handle missing values first.")
 
         self.pca = PCA(**pca_kwargs)
 
     def fit_transform(self):
-        logger.info(f"Fitting PCA on shape {self.train_df.shape}")
+        logger.info(f"Fitting PCA on shape {self.train.shape}")
 
-        train = self.pca.fit_transform(self.train_df)
-        test  = self.pca.transform(self.test_df)
-        val   = self.pca.transform(self.val_df)
+        train = self.pca.fit_transform(self.train)
+        test  = self.pca.transform(self.test)
+        val   = self.pca.transform(self.val)
 
         cols = [f"pca_{i+1}" for i in range(train.shape[1])]
+        train_idx, test_idx, val_idx = self.indexes
 
-        train_df = pd.DataFrame(train, index=self.train_df.index, columns=cols)
-        test_df  = pd.DataFrame(test,  index=self.test_df.index,  columns=cols)
-        val_df   = pd.DataFrame(val,   index=self.val_df.index,   columns=cols)
+        train_df = pd.DataFrame(train, index=train_idx, columns=cols, copy=False)
+        test_df  = pd.DataFrame(test,  index=test_idx,  columns=cols, copy=False)
+        val_df   = pd.DataFrame(val,   index=val_idx,   columns=cols, copy=False)
 
         explained = self.pca.explained_variance_ratio_.sum()
         logger.info(f"PCA finished. Explained variance ratio sum = {explained:.4f}")
@@ -67,6 +81,86 @@ class PCAWrapper:
         return train_df, test_df, val_df
 
 
+class IncrementalPCAWrapper:
+    """
+    Out-of-core counterpart of PCAWrapper: fits IncrementalPCA on a train Parquet
+    file batch by batch and transforms the three splits the same way, so memory
+    stays bounded by `batch_size` no matter how large the splits are.
+
+    Parameters
+    ----------
+    train_path, test_path, val_path : str or Path
+        Parquet files for the train / test / validation splits.
+    columns : list
+        Numeric feature columns to read; rows with a null in any of them are skipped.
+    batch_size : int
+        Rows per Parquet batch and per partial_fit call.
+    **pca_kwargs :
+        Optional keyword arguments passed to sklearn.decomposition.IncrementalPCA.
+
+    Methods
+    -------
+    fit_transform():
+        Fits on train and transforms train, test and validation.
+        Returns (train_pca, test_pca, val_pca) as float32 DataFrames with a fresh RangeIndex.
+    """
+
+    def __init__(self, train_path, test_path, val_path, columns: list, batch_size: int = 100_000, **pca_kwargs):
+        self.paths = (train_path, test_path, val_path)
+        self.columns = list(columns)
+        self.batch_size = batch_size
+
+        # Schema enforcement on the file metadata, without reading any rows
+        for path in self.paths:
+            schema = pq.read_schema(path)
+            missing = [col for col in self.columns if col not in schema.names]
+            if missing:
+                raise ValueError(f"{path} is missing columns {missing}.")
+            if not all(pa.types.is_integer(schema.field(col).type) or pa.types.is_floating(schema.field(col).type)
+                       for col in self.columns):
+                raise ValueError("IncrementalPCAWrapper only supports numeric features.")
+
+        self.pca = IncrementalPCA(batch_size=batch_size, **pca_kwargs)
+
+    def _batches(self, path):
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=self.batch_size, columns=self.columns):
+            batch = batch.drop_null()
+            if batch.num_rows:
+                yield np.column_stack([col.to_numpy(zero_copy_only=False) for col in batch.columns]).astype(np.float32, copy=False)
+
+    def _transform(self, path) -> pd.DataFrame:
+        # IncrementalPCA keeps float64 statistics; store the projection as float32 like PCAWrapper
+        parts = [self.pca.transform(X).astype(np.float32, copy=False) for X in self._batches(path)]
+        out = np.concatenate(parts) if parts else np.empty((0, self.pca.n_components_), dtype=np.float32)
+        cols = [f"pca_{i+1}" for i in range(out.shape[1])]
+        return pd.DataFrame(out, columns=cols, copy=False)
+
+    def fit_transform(self):
+        train_path, test_path, val_path = self.paths
+        logger.info(f"Fitting IncrementalPCA on {train_path} in batches of {self.batch_size}")
+
+        # partial_fit needs at least n_components rows, so short batches are held back and merged
+        min_rows = self.pca.n_components or len(self.columns)
+        pending = []
+        for X in self._batches(train_path):
+            pending.append(X)
+            if sum(len(p) for p in pending) >= min_rows:
+                self.pca.partial_fit(np.concatenate(pending))
+                pending = []
+        if pending:
+            self.pca.partial_fit(np.concatenate(pending))
+
+        train_df = self._transform(train_path)
+        test_df = self._transform(test_path)
+        val_df = self._transform(val_path)
+
+        explained = self.pca.explained_variance_ratio_.sum()
+        logger.info(f"IncrementalPCA finished. Explained variance ratio sum = {explained:.4f}")
+
+        return train_df, test_df, val_df
+
+
 class RobustScalerWrapper:
     """
     Wrapper for applying RobustScaler consistently on
@@ -88,39 +182,47 @@ class RobustScalerWrapper:
     fit_transform():
         Fits scaler on train and transforms all datasets.
         Returns (train_scaled, test_scaled, val_scaled)
+
+    Notes
+    -----
+    Features are converted once to float32 arrays; the returned DataFrames wrap
+    the float32 scaler output without copying.
     """
 
     def __init__(self, train_df: pd.DataFrame, test_df: pd.DataFrame, val_df: pd.DataFrame, **scaler_kwargs):
-        self.train_df = train_df.copy()
-        self.test_df = test_df.copy()
-        self.val_df = val_df.copy()
-
         # Validate schema
         if not (list(train_df.columns) == list(test_df.columns) == list(val_df.columns)):
             raise ValueError("Train / Test / Val must have identical columns in the same order.")
 
         # Validate numeric
-        if not all(pd.api.types.is_numeric_dtype(self.train_df[col]) for col in self.train_df.columns):
+        if not all(pd.api.types.is_numeric_dtype(train_df[col]) for col in train_df.columns):
             raise ValueError("RobustScalerWrapper only supports numeric features.")
 
+        self.train = _as_float32(train_df)
+        self.test = _as_float32(test_df)
+        self.val = _as_float32(val_df)
+        self.columns = train_df.columns
+        self.indexes = (train_df.index, test_df.index, val_df.index)
+
         # Validate NaN
-        if self.train_df.isnull().any().any():
+        if np.isnan(self.train).any():
             raise ValueError("Training dataset contains NaN values. Handle missing values first.")
 
         self.scaler = RobustScaler(**scaler_kwargs)
 
     def fit_transform(self):
-        logger.info(f"Fitting RobustScaler on data shape {self.train_df.shape}")
+        logger.info(f"Fitting RobustScaler on data shape {self.train.shape}")
 
-        train_scaled = self.scaler.fit_transform(self.train_df)
-        test_scaled  = self.scaler.transform(self.test_df)
-        val_scaled   = self.scaler.transform(self.val_df)
+        train_scaled = self.scaler.fit_transform(self.train)
+        test_scaled  = self.scaler.transform(self.test)
+        val_scaled   = self.scaler.transform(self.val)
 
-        cols = self.train_df.columns
+        cols = self.columns
+        train_idx, test_idx, val_idx = self.indexes
 
-        train_scaled = pd.DataFrame(train_scaled, index=self.train_df.index, columns=cols)
-        test_scaled  = pd.DataFrame(test_scaled,  index=self.test_df.index,  columns=cols)
-        val_scaled   = pd.DataFrame(val_scaled,   index=self.val_df.index,   columns=cols)
+        train_scaled = pd.DataFrame(train_scaled, index=train_idx, columns=cols, copy=False)
+        test_scaled  = pd.DataFrame(test_scaled,  index=test_idx,  columns=cols, copy=False)
+        val_scaled   = pd.DataFrame(val_scaled,   index=val_idx,   columns=cols, copy=False)
 
         logger.info("RobustScaler transformation complete.")
         return train_scaled, test_scaled, val_scaled
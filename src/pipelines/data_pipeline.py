@@ -2,7 +2,7 @@ import pandas as pd
 from src.process.load_raw import ProcessRaw
 from src.process.clean_data import DataCleaner, DataCleanerConfig
 from src.process.features import FeaturesCreation
-from src.utils.utils import data_spliter, save_dataframe_parquet
+from src.utils.utils import data_spliter, optimize_dtypes, save_dataframe_parquet
 from src.utils.custom_exception import CustomException
 from src.utils.custom_logger import get_logger
 from src.config.settings import (
@@ -65,6 +65,8 @@ def data_pipeline(rebuild_interim: bool = False):
 
         logger.info(f"Dataset size after cleaning: {len(cleaned):,} rows")
 
+        cleaned = optimize_dtypes(cleaned)
+
         # ----- Split -----
         logger.info("Splitting dataset into Train / Test / Validation")
         train_df, test_df, val_df = data_spliter(
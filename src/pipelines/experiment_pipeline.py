@@ -1,8 +1,44 @@
+import itertools
+from pathlib import Path
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from joblib import Parallel, delayed
 from src.pipelines.train_pipeline import run_training, evaluate
 
 
-def run_all_experiments(df_train, df_test, df_val, models, clusters, pre_processing_flags, look_features):
+def _run_one(model_cls, cluster, type_process, features, df_train, df_test, df_val, look_features):
+    """
+    Trains and evaluates a single (model, cluster, preprocessing) experiment.
+
+    Returns
+    -------
+    list
+        One labeled results DataFrame per dataset (train, test, validation).
+    """
+    model_name = model_cls.__name__
+    preprocessing_name = str(type_process.__name__) if type_process else "None"
+
+    (train_pred, test_pred, val_pred), (train_features, test_features, val_features) = run_training(
+        model_cls, df_train, df_test, df_val, features=features, n_clusters=cluster
+    )
+
+    results = []
+    splits = [('train', df_train, train_pred, train_features), ('test', df_test, test_pred, test_features), ('validation', df_val, val_pred, val_features)]
+    for name, df, pred, features in splits:
+        # under copy-on-write assign shares the base frame's blocks and only adds the 'pred' column
+        with pd.option_context("mode.copy_on_write", True):
+            results_df = evaluate(df.assign(pred=pred), features, look_features=look_features)
+        results_df['dataset'] = name
+        results_df['model'] = model_name
+        results_df['n_clusters'] = cluster
+        results_df['preprocessing'] = preprocessing_name
+        results.append(results_df)
+    return results
+
+
+def run_all_experiments(df_train, df_test, df_val, models, clusters, pre_processing_flags, look_features, n_jobs=-1,
+                        out_path=None):
     """
     Runs a grid of clustering experiments and returns the results.
 
@@ -26,38 +62,60 @@ def run_all_experiments(df_train, df_test, df_val, models, clusters, pre_process
         A list of preprocessing functions to apply.
     look_features : list
         A list of feature names to use for evaluation.
+    n_jobs : int
+        Number of worker processes for the experiment grid (-1 uses all cores).
+    out_path : str or Path, optional
+        If given, each experiment's results are appended to this Parquet file
+        as they finish instead of being collected in memory.
 
     Returns
     -------
-    pd.DataFrame
-        A DataFrame containing the aggregated results from all experiments.
+    pd.DataFrame or Path
+        A DataFrame containing the aggregated results from all experiments,
+        or ``out_path`` when the results were streamed to disk.
     """
+    # Pre-processing does not depend on the model or k, so fit each scaler / PCA once per flag
+    features_cache = {}
+    for type_process in pre_processing_flags:
+        if type_process not in features_cache:
+            features = (df_train, df_test, df_val)
+            if type_process:
+                features = type_process(*features)
+            features_cache[type_process] = features
+
+    # Experiments are independent; loky memory-maps the large shared arrays into the workers
+    grid = list(itertools.product(models, clusters, pre_processing_flags))
+    experiments = Parallel(n_jobs=n_jobs, prefer="processes", batch_size=1, return_as="generator")(
+        delayed(_run_one)(model_cls, cluster, type_process, features_cache[type_process],
+                          df_train, df_test, df_val, look_features)
+        for model_cls, cluster, type_process in grid
+    )
+
     all_results = []
+    writer = None
+    try:
+        for (model_cls, cluster, type_process), results in zip(grid, experiments):
+            preprocessing_name = str(type_process.__name__) if type_process else "None"
+            print(f"Experiment: Model={model_cls.__name__}, Clusters={cluster}, Preprocessing={preprocessing_name}")
+            for results_df in results:
+                print(f"\n{results_df['dataset'].iloc[0].capitalize()} Results:\n{results_df}")
+            print('#' * 50 + '\n')
+
+            if out_path is None:
+                all_results.extend(results)
+                continue
+
+            # one row group per experiment, cast to the schema of the first one written
+            table = pa.Table.from_pandas(pd.concat(results, ignore_index=True), preserve_index=False,
+                                         schema=writer.schema if writer is not None else None)
+            if writer is None:
+                Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+                writer = pq.ParquetWriter(out_path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
 
-    for model_cls in models:
-        for cluster in clusters:
-            for type_process in pre_processing_flags:
-                model_name = model_cls.__name__
-                preprocessing_name = str(type_process.__name__) if type_process else "None"
-                print(f"Running experiment: Model={model_name}, Clusters={cluster}, Preprocessing={preprocessing_name}")
-
-                # Make copies to ensure experiment isolation, as run_training adds a 'pred' column
-                df_train_copy, df_test_copy, df_val_copy = df_train.copy(), df_test.copy(), df_val.copy()
-
-                (df_train_res, df_test_res, df_val_res), (train_features, test_features, val_features) = run_training(
-                    model_cls, df_train_copy, df_test_copy, df_val_copy, pre_processing=type_process, n_clusters=cluster
-                )
-
-                # Evaluate all datasets
-                for name, df_res, features in [('train', df_train_res, train_features), ('test', df_test_res, test_features), ('validation', df_val_res, val_features)]:
-                    results_df = evaluate(df_res, features, look_features=look_features)
-                    results_df['dataset'] = name
-                    results_df['model'] = model_name
-                    results_df['n_clusters'] = cluster
-                    results_df['preprocessing'] = preprocessing_name
-                    all_results.append(results_df)
-                    print(f"\n{name.capitalize()} Results:\n{results_df}")
-
-                print('#' * 50 + '\n')
-
-    return pd.concat(all_results, ignore_index=True)
\ No newline at end of file
+    if out_path is not None:
+        return Path(out_path)
+    return pd.concat(all_results, ignore_index=True)
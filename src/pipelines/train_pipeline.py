@@ -3,14 +3,50 @@ from sklearn.metrics import silhouette_score
 import numpy as np
 from scipy.stats import wasserstein_distance
 
+def cluster_profile(X: np.ndarray, labels: np.ndarray, k: int):
+    """
+    Per-cluster column means and sizes for integer labels in ``0..k-1``.
+
+    Rows are stably sorted by label once, so every cluster is a contiguous
+    block reduced with ``np.add.reduceat``. NaNs are skipped column-wise, as
+    in ``groupby().mean()``.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        ``(means, sizes)`` with shapes ``(k, n_features)`` and ``(k,)``.
+        Empty clusters have size 0 and NaN means.
+    """
+    labels = np.asarray(labels, dtype=np.intp)
+    order = labels.argsort(kind="stable")
+    Xs = X[order]
+    boundaries = np.searchsorted(labels[order], np.arange(k + 1))
+    sizes = np.diff(boundaries)
+
+    means = np.full((k, X.shape[1]), np.nan)
+    present = np.flatnonzero(sizes)
+    if present.size:
+        # empty clusters have zero-length blocks, so the non-empty starts tile the rows exactly
+        starts = boundaries[present]
+        valid = ~np.isnan(Xs)
+        sums = np.add.reduceat(np.where(valid, Xs, 0.0), starts, axis=0)
+        counts = np.add.reduceat(valid, starts, axis=0, dtype=np.int64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means[present] = sums / counts
+    return means, sizes
+
+
 def evaluate(df, features_df, look_features):
     """
     Combines cluster feature means, value counts, and silhouette score
     into a single DataFrame.
     """
-    means = df.groupby("pred")[look_features].mean()
-    counts = df["pred"].value_counts().rename("cluster_size")
-    results_df = pd.concat([means, counts], axis=1)
+    labels = df["pred"].to_numpy()
+    means, sizes = cluster_profile(df[look_features].to_numpy(dtype=np.float64), labels, int(labels.max()) + 1)
+    present = np.flatnonzero(sizes)
+    index = pd.Index(present, name="pred")
+    results_df = pd.DataFrame(means[present], index=index, columns=look_features)
+    results_df["cluster_size"] = sizes[present]
 
     # Calculate silhouette score, requires at least 2 clusters
     if df['pred'].nunique() > 1:
@@ -60,19 +96,31 @@ def run_training(model_cls,
                 df_test : pd.DataFrame,
                 df_val : pd.DataFrame, 
                 pre_processing = False, 
+                features = None,
                 **kwargs):
 
-    train_features, test_features, val_features = df_train.copy(), df_test.copy(), df_val.copy()
-    if pre_processing:
-        train_features, test_features, val_features = pre_processing(train_features, test_features, val_features)
+    """
+    Fits `model_cls` on the train features and predicts all three splits.
+
+    The input frames are never modified; cluster labels come back as arrays
+    so callers can attach them where needed (e.g. ``df.assign(pred=...)``).
+
+    Returns
+    -------
+    tuple
+        ``(train_pred, test_pred, val_pred), (train_features, test_features, val_features)``
+    """
+    if features is not None:
+        # (train, test, val) already pre-processed by the caller, e.g. shared across a grid
+        train_features, test_features, val_features = features
+    else:
+        train_features, test_features, val_features = df_train, df_test, df_val
+        if pre_processing:
+            train_features, test_features, val_features = pre_processing(train_features, test_features, val_features)
 
     model = model_cls(**kwargs)
     train_pred, test_pred, val_pred = model.train_and_predict(
         train_features, test_features, val_features
     )
 
-    df_train["pred"] = train_pred
-    df_test["pred"] = test_pred
-    df_val["pred"] = val_pred
-
-    return (df_train, df_test, df_val), (train_features, test_features, val_features)
+    return (train_pred, test_pred, val_pred), (train_features, test_features, val_features)
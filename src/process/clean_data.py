@@ -192,7 +192,7 @@ class DataCleaner:
             )
 
             # funds born after cutoff (no records before cutoff)
-            fund_first_dates = df.groupby("fund_cnpj")["report_date"].min()
+            fund_first_dates = df.groupby("fund_cnpj", observed=True, sort=False)["report_date"].min()
             born_after_cutoff = fund_first_dates[fund_first_dates >= cutoff].index
 
             bad_cnpjs = set(bad_low_shareholders) | set(born_after_cutoff)
@@ -242,7 +242,7 @@ class DataCleaner:
             df = df.sort_values(["fund_cnpj", "report_date"])
             
             # Calculate gaps between consecutive dates for each fund
-            df["date_gap"] = df.groupby("fund_cnpj")["report_date"].diff()
+            df["date_gap"] = df.groupby("fund_cnpj", observed=True, sort=False)["report_date"].diff()
             
             # Convert gap to appropriate unit (e.g., months, days)
             # Choose one of these based on your needs:
@@ -257,7 +257,7 @@ class DataCleaner:
             # You'd need to implement custom logic here
             
             # Find funds with max gap > threshold
-            max_gaps = df.groupby("fund_cnpj")["date_gap_days"].max()
+            max_gaps = df.groupby("fund_cnpj", observed=True, sort=False)["date_gap_days"].max()
             bad_funds = max_gaps[max_gaps > max_gap].index
             
             # Filter out these funds
@@ -283,7 +283,7 @@ class DataCleaner:
 
         # compute returns per fund
         df['return'] = (
-            df.groupby('fund_cnpj')['quota_value']
+            df.groupby('fund_cnpj', observed=True, sort=False)['quota_value']
             .transform(lambda s: s.pct_change())
         )
 
@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import pandas as pd
 import numpy as np
-from functools import partial
-from typing import Optional, List, Dict, Any
+from functools import cached_property, partial
+from typing import Optional, List, Dict, Any, Sequence
 import warnings
 
 from src.utils.custom_logger import get_logger
 
 logger = get_logger(__name__)
 
+# Default rolling-std windows behind the vol_* columns
+VOLATILITY_WINDOWS = (5, 10, 15)
 
-def calculate_correlation_features(group: pd.DataFrame) -> pd.Series:
+
+def calculate_correlation_features(group: pd.DataFrame,
+                                   windows: Sequence[int] = VOLATILITY_WINDOWS) -> pd.Series:
     """
     Calculate correlation features from a group DataFrame.
     
@@ -19,6 +23,8 @@ def calculate_correlation_features(group: pd.DataFrame) -> pd.Series:
     ----------
     group : pd.DataFrame
         A pandas DataFrame containing data for a single fund.
+    windows : Sequence[int], optional
+        Volatility windows whose ``vol_<w>`` columns are correlated with returns.
     
     Returns
     -------
@@ -31,19 +37,14 @@ def calculate_correlation_features(group: pd.DataFrame) -> pd.Series:
     if len(group) > 1:
         # Use numpy for faster correlation calculation
         return_vals = group['return'].values
-        vol_5_vals = group['vol_5'].values
-        vol_10_vals = group['vol_10'].values
-        vol_15_vals = group['vol_15'].values
         
         # Calculate correlations with NaN handling
-        features['corr_return_vol5'] = np.corrcoef(return_vals, vol_5_vals)[0, 1] if len(return_vals) > 1 else np.nan
-        features['corr_return_vol10'] = np.corrcoef(return_vals, vol_10_vals)[0, 1] if len(return_vals) > 1 else np.nan
-        features['corr_return_vol15'] = np.corrcoef(return_vals, vol_15_vals)[0, 1] if len(return_vals) > 1 else np.nan
+        for win in windows:
+            features[f'corr_return_vol{win}'] = np.corrcoef(return_vals, group[f'vol_{win}'].values)[0, 1]
     else:
         # For groups with only 1 observation, set correlations to NaN
-        features['corr_return_vol5'] = np.nan
-        features['corr_return_vol10'] = np.nan
-        features['corr_return_vol15'] = np.nan
+        for win in windows:
+            features[f'corr_return_vol{win}'] = np.nan
     
     return pd.Series(features)
 
@@ -89,7 +90,7 @@ class FeaturesCreation:
     df : pd.DataFrame
         Input dataframe with fund data
     volatility_windows : List[int], optional
-        Windows for volatility calculation, default is [5, 10, 15]
+        Windows for volatility calculation, default is ``VOLATILITY_WINDOWS``
     min_periods_for_correlation : int, optional
         Minimum periods required for correlation calculation, default is 2
     
@@ -126,15 +127,47 @@ class FeaturesCreation:
             df = df.drop_duplicates(subset=['fund_cnpj', 'report_date'], keep='first')
         
         # Store parameters
-        self.volatility_windows = volatility_windows or [5, 10, 15]
+        self.volatility_windows = volatility_windows or list(VOLATILITY_WINDOWS)
         self.min_periods_for_correlation = min_periods_for_correlation
         
         # Store original data
         self.original_shape = df.shape
-        self.df = df.copy().sort_values(["fund_cnpj", "report_date"])
+        self.df = df.sort_values(["fund_cnpj", "report_date"], kind="stable", ignore_index=True)
         
         logger.info(f"FeaturesCreation initialized with {self.original_shape} rows")
 
+    @cached_property
+    def group_by_cnpj(self) -> pd.core.groupby.DataFrameGroupBy:
+        """
+        Per-fund groupby of ``self.df``, built on first use and then reused.
+
+        Feature methods add columns to ``self.df`` in place, so the cached
+        grouping stays valid for every column created later.
+        """
+        return self.df.groupby("fund_cnpj", sort=False, observed=True)
+
+    @cached_property
+    def _fund_blocks(self) -> tuple:
+        """
+        Contiguous fund blocks of the (fund_cnpj, report_date)-sorted ``self.df``.
+
+        Computed once and shared by the vectorised per-fund features; the row
+        order of ``self.df`` never changes after ``__init__``.
+
+        Returns
+        -------
+        tuple
+            ``(is_start, starts, codes)``: mask of each fund's first row, the
+            positions of those rows, and the 0-based block number of every row.
+        """
+        cnpj = self.df["fund_cnpj"]
+        if isinstance(cnpj.dtype, pd.CategoricalDtype):
+            cnpj = cnpj.cat.codes
+        cnpj = cnpj.to_numpy()
+        is_start = np.ones(len(cnpj), dtype=bool)
+        is_start[1:] = cnpj[1:] != cnpj[:-1]
+        return is_start, np.flatnonzero(is_start), np.cumsum(is_start) - 1
+
     def run(self, features_to_create: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Create all features in the dataframe.
@@ -199,6 +232,7 @@ class FeaturesCreation:
         """
         try:
             logger.info("Starting fund-level feature aggregation")
+            windows = self.volatility_windows
             
             # Calculate basic aggregates in one pass
             agg_dict = {
@@ -222,19 +256,15 @@ class FeaturesCreation:
                 'avg_shareholders': ('num_shareholders', 'mean'),
                 
                 ## Volatility
-                'mean_std_5': ('vol_5', 'mean'),
-                'mean_std_10': ('vol_10', 'mean'),
-                'mean_std_15': ('vol_15', 'mean'),
-                'std_std_5': ('vol_5', 'std'),
-                'std_std_10': ('vol_10', 'std'),
-                'std_std_15': ('vol_15', 'std'),
+                **{f'mean_std_{win}': (f'vol_{win}', 'mean') for win in windows},
+                **{f'std_std_{win}': (f'vol_{win}', 'std') for win in windows},
             }
             
-            agg_features = self.df.groupby("fund_cnpj").agg(**agg_dict)
+            agg_features = self.group_by_cnpj.agg(**agg_dict)
             
             # Calculate correlation features
             logger.info("Calculating correlation features")
-            corr_features = self.df.groupby("fund_cnpj").apply(calculate_correlation_features)
+            corr_features = self.group_by_cnpj.apply(calculate_correlation_features, windows=windows)
             agg_features = pd.concat([agg_features, corr_features], axis=1)
             
             # Calculate derived ratios safely
@@ -245,18 +275,11 @@ class FeaturesCreation:
                 agg_features['mean_return'], 
                 agg_features['std_return']
             )
-            agg_features['sharpe_mean_std_5'] = safe_divide(
-                agg_features['mean_return'], 
-                agg_features['mean_std_5']
-            )
-            agg_features['sharpe_mean_std_10'] = safe_divide(
-                agg_features['mean_return'], 
-                agg_features['mean_std_10']
-            )
-            agg_features['sharpe_mean_std_15'] = safe_divide(
-                agg_features['mean_return'], 
-                agg_features['mean_std_15']
-            )
+            for win in windows:
+                agg_features[f'sharpe_mean_std_{win}'] = safe_divide(
+                    agg_features['mean_return'], 
+                    agg_features[f'mean_std_{win}']
+                )
             
             # Drawdown ratios (use absolute value for drawdown)
             agg_features['ret_by_DD'] = safe_divide(
@@ -276,15 +299,12 @@ class FeaturesCreation:
                 agg_features['max_time_drawdown']
             )
             
-            # Volatility ratios
-            agg_features['volatility_ratio_5_10'] = safe_divide(
-                agg_features['mean_std_5'],
-                agg_features['mean_std_10']
-            )
-            agg_features['volatility_ratio_10_15'] = safe_divide(
-                agg_features['mean_std_10'],
-                agg_features['mean_std_15']
-            )
+            # Volatility ratios between consecutive windows
+            for short, long in zip(windows, windows[1:]):
+                agg_features[f'volatility_ratio_{short}_{long}'] = safe_divide(
+                    agg_features[f'mean_std_{short}'],
+                    agg_features[f'mean_std_{long}']
+                )
             
             # Clean data
             logger.info("Cleaning aggregated data")
@@ -330,10 +350,23 @@ class FeaturesCreation:
             Updated dataframe with return column
         """
         logger.info("Creating 'return' feature")
-        self.df["return"] = (
-            self.df.groupby("fund_cnpj")[col]
-            .pct_change()
-        )
+        # self.df is sorted by (fund_cnpj, report_date), so every fund is a contiguous
+        # block and the returns are one shifted division with the fund boundaries masked
+        is_start, _, _ = self._fund_blocks
+
+        q = self.df[col].to_numpy(dtype=np.float64)
+        # forward-fill gaps within each fund, as groupby().pct_change() does
+        positions = np.arange(len(q))
+        q = q[np.maximum.accumulate(np.where(~np.isnan(q) | is_start, positions, 0))]
+
+        prev = np.empty_like(q)
+        prev[:1] = np.nan
+        prev[1:] = q[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ret = q / prev - 1.0
+        ret[is_start] = np.nan
+
+        self.df["return"] = ret
         return self.df
 
     def _add_gross_by_net(self) -> pd.DataFrame:
@@ -369,15 +402,52 @@ class FeaturesCreation:
             Updated dataframe with volatility columns
         """
         logger.info(f"Creating volatility features for windows: {list_windows}")
-        
-        for win in list_windows:
-            self.df[f"vol_{win}"] = (
-                self.df.groupby("fund_cnpj")[col]
-                .rolling(window=win, min_periods=max(2, win//2))
-                .std()
-                .reset_index(level=0, drop=True)
-            )
-        
+
+        if self.df.empty:
+            for win in list_windows:
+                self.df[f"vol_{win}"] = np.nan
+            return self.df
+
+        # One pass of per-fund prefix sums (values, squares, counts) serves every
+        # window; each window is clipped at its fund's first row, so nothing leaks
+        # across funds
+        _, starts, codes = self._fund_blocks
+        positions = np.arange(len(codes))
+        group_start = starts[codes]
+
+        x = self.df[col].to_numpy(dtype=np.float64)
+        # pandas' rolling skips NaN and +-inf alike
+        valid = np.isfinite(x)
+        x = np.where(valid, x, 0.0)
+        # centre each fund on its own mean to limit cancellation in sum(x^2) - sum(x)^2 / n
+        n_valid = np.add.reduceat(valid.astype(np.int64), starts)
+        fund_mean = np.add.reduceat(x, starts) / np.maximum(n_valid, 1)
+        x = np.where(valid, x - fund_mean[codes], 0.0)
+
+        # cumulative sums restart at every fund (pandas' group cumsum is compensated),
+        # so one fund's outliers never erode the precision of the next fund's windows
+        def fund_cumsum(a):
+            return pd.Series(a).groupby(codes, sort=False).cumsum().to_numpy()
+
+        cs, cs2 = fund_cumsum(x), fund_cumsum(x * x)
+        cnt = np.cumsum(valid)
+
+        out = np.empty((len(x), len(list_windows)))
+        for j, win in enumerate(list_windows):
+            lo = np.maximum(positions - win + 1, group_start)
+            inside = lo > group_start  # the window does not reach back to the fund's first row
+            before = lo - 1
+            n = cnt - np.where(lo > 0, cnt[before], 0)
+            s = cs - np.where(inside, cs[before], 0.0)
+            s2 = cs2 - np.where(inside, cs2[before], 0.0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                var = np.maximum(s2 - s * s / n, 0.0) / (n - 1)
+            var[n < max(2, win//2)] = np.nan
+            out[:, j] = np.sqrt(var)
+
+        # single insertion of all volatility columns
+        self.df[[f"vol_{win}" for win in list_windows]] = out
+
         return self.df
 
     def _add_drawdown(self, col: str) -> pd.DataFrame:
@@ -398,7 +468,7 @@ class FeaturesCreation:
         
         # Calculate rolling maximum (peak)
         peak = (
-            self.df.groupby("fund_cnpj")[col]
+            self.group_by_cnpj[col]
             .transform(lambda x: x.expanding().max())
         )
         
@@ -439,7 +509,7 @@ class FeaturesCreation:
         
         # Apply the vectorized function
         self.df['time_in_drawdown'] = (
-            self.df.groupby('fund_cnpj')[col]
+            self.group_by_cnpj[col]
             .transform(vectorized_consecutive_drawdown)
         )
         
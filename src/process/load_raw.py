@@ -8,6 +8,8 @@ import warnings
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from src.config.settings import DATA_RAW_UNZIP_PATH, DATA_PROCESSED_PATH, PROJECT_ROOT, DATA_INTERIM_PATH
 from src.utils.custom_exception import raise_from_exception, CustomException
@@ -16,14 +18,35 @@ from src.process.validate_data import validate_required_columns, generate_source
 
 logger = get_logger(__name__)
 
+# Known CVM daily-report headers and their Arrow types. Columns outside this
+# map (and NR_COTST, which may be null) are still inferred by the parser.
+RAW_COLUMN_TYPES: Dict[str, pa.DataType] = {
+    "TP_FUNDO": pa.string(),
+    "TP_FUNDO_CLASSE": pa.string(),
+    "CNPJ_FUNDO": pa.string(),
+    "CNPJ_FUNDO_CLASSE": pa.string(),
+    "ID_SUBCLASSE": pa.string(),
+    "DT_COMPTC": pa.date32(),
+    "VL_QUOTA": pa.float64(),
+    "VL_TOTAL": pa.float64(),
+    "VL_PATRIM_LIQ": pa.float64(),
+    "CAPTC_DIA": pa.float64(),
+    "RESG_DIA": pa.float64(),
+}
+
+# Arrow parses each block on its own thread. 16 MiB blocks split a ~100 MiB
+# monthly file into enough pieces to keep several cores busy while keeping
+# per-block overhead well below the default 1 MiB blocks.
+RAW_CSV_BLOCK_SIZE = 1 << 24
+
 
 class ProcessRaw:
     """Load and concatenate raw CSV files, then save the processed DataFrame.
 
     It walks `DATA_RAW_UNZIP_PATH`, reads CSV files (default sep=';'),
     concatenates them into a single DataFrame, and saves the result to
-    `DATA_PROCESSED_PATH` as `processed.csv` (unless a different name is
-    provided).
+    `DATA_INTERIM_PATH` as `interim.parquet` (unless a different name,
+    format or target is provided).
     """
 
     def __init__(self, raw_path: Optional[Path] = None, 
@@ -164,7 +187,7 @@ class ProcessRaw:
 
             original_rows = len(df)
             df_sorted = df.sort_values('num_shareholders', ascending=False)
-            idx = df_sorted.groupby(['fund_cnpj', 'report_date'])['num_shareholders'].idxmax()
+            idx = df_sorted.groupby(['fund_cnpj', 'report_date'], observed=True)['num_shareholders'].idxmax()
             df = df.loc[idx].reset_index(drop=True)
             removed = original_rows - len(df)
             logger.info(f"Removed {removed} duplicate rows, keeping max num_shareholders")
@@ -173,10 +196,10 @@ class ProcessRaw:
             df['month'] = df['report_date'].dt.strftime('%m-%Y')
 
             # Count per fund per month
-            df['appearances_per_month'] = df.groupby(['fund_cnpj', 'month'])['fund_cnpj'].transform('count')
+            df['appearances_per_month'] = df.groupby(['fund_cnpj', 'month'], observed=True, sort=False)['fund_cnpj'].transform('count')
 
             # Find the maximum monthly appearances for each fund (across all months)
-            df['max_monthly_appearances'] = df.groupby('month')['appearances_per_month'].transform('max')
+            df['max_monthly_appearances'] = df.groupby('month', sort=False)['appearances_per_month'].transform('max')
             
             # Validate and check for missing CNPJ
             self._validate_and_report(df, provenance)
@@ -219,16 +242,8 @@ class ProcessRaw:
                             on_bad_lines='skip'
                         )
                 else:
-                    df = pd.read_csv(
-                        file_path, 
-                        sep=sep, 
-                        encoding=encoding,
-                        low_memory=False,
-                        on_bad_lines='skip'
-                    )
+                    df = self._read_csv_arrow(file_path, sep, encoding)
 
-                
-                
                 logger.debug(f"Successfully read {file_path.name} with {encoding} encoding")
                 return df
                 
@@ -241,6 +256,50 @@ class ProcessRaw:
         logger.error(f"Failed to read {file_path.name} with any encoding")
         return None
 
+    @staticmethod
+    def _read_csv_arrow(file_path: Path, sep: str, encoding: str) -> pd.DataFrame:
+        """Read a whole CSV with Arrow's multithreaded parser.
+
+        Mirrors the pandas defaults used for sampled reads: malformed rows are
+        skipped and empty strings become nulls. Dates come back as datetime64[ns].
+        Known CVM columns are parsed with `RAW_COLUMN_TYPES`; if a file does not
+        fit that schema it is re-read with full type inference. The file is
+        memory-mapped and split into `RAW_CSV_BLOCK_SIZE` blocks for parsing.
+        Raises UnicodeDecodeError when any column holds bytes that are not
+        valid in `encoding`.
+        """
+        read_options = pa_csv.ReadOptions(encoding=encoding, use_threads=True, block_size=RAW_CSV_BLOCK_SIZE)
+        parse_options = pa_csv.ParseOptions(delimiter=sep, invalid_row_handler=lambda row: "skip")
+
+        def read(convert_options: pa_csv.ConvertOptions) -> pa.Table:
+            with pa.memory_map(str(file_path), "r") as source:
+                return pa_csv.read_csv(
+                    source,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                )
+
+        try:
+            table = read(pa_csv.ConvertOptions(column_types=RAW_COLUMN_TYPES, strings_can_be_null=True))
+        except pa.ArrowInvalid as e:
+            logger.debug(f"Typed read of {file_path.name} failed ({e}); inferring types")
+            table = read(pa_csv.ConvertOptions(strings_can_be_null=True))
+
+        # Arrow does not fail on bytes that are invalid in `encoding`; it infers
+        # binary columns instead, so treat those as a decode error and let the
+        # caller try the next encoding
+        binary_cols = [field.name for field in table.schema if pa.types.is_binary(field.type)]
+        if binary_cols:
+            raise UnicodeDecodeError(encoding, b"", 0, 0, f"undecodable bytes in columns {binary_cols}")
+
+        return table.to_pandas(
+            split_blocks=True,
+            self_destruct=True,
+            date_as_object=False,
+            coerce_temporal_nanoseconds=True,
+        )
+
     def _process_single_file(self, df: pd.DataFrame, source_name: str) -> Optional[pd.DataFrame]:
         """Process a single file's dataframe."""
         try:
@@ -574,7 +633,8 @@ class ProcessRaw:
         sep: str = ";",
         allow_full_csv: bool = False,
         target: str = "interim",
-        compression: str = "snappy"
+        compression: str = "zstd",
+        row_group_size: int = 1_000_000
     ) -> Path:
         """Save dataframe in the chosen format and also write a small CSV sample."""
         try:
@@ -594,7 +654,8 @@ class ProcessRaw:
                         out_path, 
                         index=False, 
                         compression=compression,
-                        engine='pyarrow'
+                        engine='pyarrow',
+                        row_group_size=row_group_size
                     )
                     logger.info(f"Saved dataframe as parquet to {out_path} (pyarrow)")
                 except Exception as e1:
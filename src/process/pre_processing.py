@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from src.models.model import PCAWrapper, RobustScalerWrapper
 
@@ -83,9 +84,10 @@ def PCA(df_train : pd.DataFrame, df_test : pd.DataFrame, df_val : pd.DataFrame):
 
 def just_filter(df_train : pd.DataFrame, df_test : pd.DataFrame, df_val : pd.DataFrame):
     keep_cols = ['mean_return', 'median_return', 'std_return', 'avg_time_drawdown', 'sharpe', 'max_drawdown']
-    df_train = df_train[keep_cols]
-    df_test = df_test[keep_cols]
-    df_val = df_val[keep_cols]
+    # float32 like the scaled / PCA variants, so every model in the grid sees the same precision
+    df_train = df_train[keep_cols].astype(np.float32)
+    df_test = df_test[keep_cols].astype(np.float32)
+    df_val = df_val[keep_cols].astype(np.float32)
 
     return df_train, df_test, df_val
 
@@ -22,6 +22,20 @@ def validate_required_columns(df: pd.DataFrame, required_columns: List[str]) ->
 
 
 
+def _missing_record(src: str, na: pd.DataFrame) -> dict:
+    """Summarise a null mask of the required columns for one source file."""
+    total = len(na)
+    missing_counts = na.sum()
+    fully_empty = int(na.all(axis=1).sum())
+    any_missing = int(na.any(axis=1).sum())
+    return {
+        "source_file": src,
+        "total_rows": total,
+        **{f"missing_{c}": int(n) for c, n in missing_counts.items()},
+        "fully_empty_rows": fully_empty,
+        "rows_with_any_missing_required": any_missing,
+        "missing_fraction_pct": (any_missing / total * 100.0) if total else 0.0,
+    }
 
 
 def generate_source_report(df: pd.DataFrame, out_dir: Path, required_columns: List[str], name: str = "data", write_csv: bool = True, per_source: Optional[List[Tuple[str, pd.DataFrame]]] = None) -> pd.DataFrame:
@@ -53,36 +67,15 @@ def generate_source_report(df: pd.DataFrame, out_dir: Path, required_columns: Li
     # dataframe (keeping the DataFrame clean from provenance metadata).
     if per_source is not None:
         for src, group in per_source:
-            total = len(group)
-            missing_counts = {f"missing_{c}": int(group[c].isna().sum()) for c in required_columns}
-            fully_empty = int(group[required_columns].isna().all(axis=1).sum())
-            any_missing = int(group[required_columns].isna().any(axis=1).sum())
-            records.append({
-                "source_file": src,
-                "total_rows": total,
-                **missing_counts,
-                "fully_empty_rows": fully_empty,
-                "rows_with_any_missing_required": any_missing,
-                "missing_fraction_pct": (any_missing / total * 100.0) if total else 0.0,
-            })
+            records.append(_missing_record(src, group[required_columns].isna()))
     else:
         if "source_file" not in df.columns:
             raise CustomException("DataFrame missing 'source_file' column; enable provenance tracking in ProcessRaw.")
 
-        grouped = df.groupby("source_file")
-        for src, group in grouped:
-            total = len(group)
-            missing_counts = {f"missing_{c}": int(group[c].isna().sum()) for c in required_columns}
-            fully_empty = int(group[required_columns].isna().all(axis=1).sum())
-            any_missing = int(group[required_columns].isna().any(axis=1).sum())
-            records.append({
-                "source_file": src,
-                "total_rows": total,
-                **missing_counts,
-                "fully_empty_rows": fully_empty,
-                "rows_with_any_missing_required": any_missing,
-                "missing_fraction_pct": (any_missing / total * 100.0) if total else 0.0,
-            })
+        # One null mask for the whole frame, split by source afterwards
+        na = df[required_columns].isna()
+        for src, group_na in na.groupby(df["source_file"]):
+            records.append(_missing_record(src, group_na))
 
     report_df = pd.DataFrame.from_records(records)
     if write_csv:
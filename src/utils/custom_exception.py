@@ -5,6 +5,7 @@ traceback into the project's `logs/` folder using the project's logger.
 """
 from __future__ import annotations
 
+import sys
 import traceback
 from typing import Any, Optional
 
@@ -30,20 +31,21 @@ class CustomException(Exception):
         self.original_exception = original_exception
 
         tb = None
-        # If there's an active exception, get its formatted traceback
-        try:
-            tb = traceback.format_exc()
-        except Exception:
-            tb = None
+        # Only format a traceback while an exception is being handled
+        if sys.exc_info()[0] is not None:
+            try:
+                tb = traceback.format_exc()
+            except Exception:
+                tb = None
 
         full_message = message
         if original_exception is not None:
             full_message = f"{full_message} | Original: {repr(original_exception)}"
-        if tb and tb != "None\n":
+        if tb:
             full_message = f"{full_message}\nTraceback:\n{tb}"
 
         # Log the error with traceback
-        _logger.error(full_message)
+        _logger.error("%s", full_message)
 
         # Initialize the base Exception with the full message
         super().__init__(full_message)
@@ -1,22 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
 from src.config.settings import (
 DATA_TRAIN_PATH_WITH_FEATURES,
 DATA_TEST_PATH_WITH_FEATURES,
 DATA_VALIDATION_PATH_WITH_FEATURES)
-import pandas as pd
+import pyarrow.parquet as pq
 
-def load_data_with_features():
+
+def _read_features(path, columns=None):
+    # Arrow reads every column on its own thread pool and drops incomplete rows
+    # before conversion. Nulls are dropped over every aggregate column, not just
+    # the ones kept, so a fund with e.g. an undefined kurtosis stays out of the
+    # clustering whatever subset of features is requested; `columns` is only
+    # applied afterwards and saves no I/O
+    table = pq.read_table(path, use_threads=True, use_pandas_metadata=True).drop_null()
+    df = table.to_pandas(self_destruct=True)
+    return df[columns] if columns is not None else df
+
+def load_data_with_features(columns=None):
     """
     
     Loads the feature ready data
     from the pathes
 
+    Args:
+        columns: optional list of columns to keep. This is a filter
+            applied after the full file is read and rows with a null
+            in any of its columns are dropped; it does not reduce I/O.
+            Defaults to every column.
+
     Returns:
         df_train, df_test, df_val
     
     """
 
-    df_train = pd.read_parquet(DATA_TRAIN_PATH_WITH_FEATURES).dropna()
-    df_test = pd.read_parquet(DATA_TEST_PATH_WITH_FEATURES).dropna()
-    df_val = pd.read_parquet(DATA_VALIDATION_PATH_WITH_FEATURES).dropna()
+    paths = (DATA_TRAIN_PATH_WITH_FEATURES, DATA_TEST_PATH_WITH_FEATURES, DATA_VALIDATION_PATH_WITH_FEATURES)
+
+    # the Arrow reader releases the GIL, so the three files load concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        df_train, df_test, df_val = executor.map(lambda path: _read_features(path, columns), paths)
 
     return df_train, df_test, df_val
\ No newline at end of file
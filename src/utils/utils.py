@@ -1,6 +1,6 @@
 import pandas as pd
 from sklearn.model_selection import train_test_split
-from typing import Tuple
+from typing import Sequence, Tuple
 
 from src.utils.custom_logger import get_logger
 from src.utils.custom_exception import CustomException
@@ -9,6 +9,10 @@ from pathlib import Path
 
 logger = get_logger(__name__)
 
+# quota_value is left in float64: daily returns are small ratios of
+# consecutive quotas and lose most of their digits in float32.
+FLOAT32_COLUMNS = ("total_value", "net_asset_value", "daily_inflow", "daily_redemptions")
+
 
 def data_spliter(
     df: pd.DataFrame,
@@ -52,18 +56,22 @@ def data_spliter(
     try:
         logger.info("Starting dataset split process...")
 
-        df = df.copy()
-
         if date_col not in df.columns:
             raise CustomException(f"Column '{date_col}' does not exist in dataframe.")
 
-        val_df = df[df[date_col] >= val_cutoff]
-        if not train_test_cutoff:
-            # validation = >= cutoff
-            
+        dates = df[date_col]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors="coerce")
 
+        # Parse each cutoff once and compare on the raw datetime64 array
+        val_ts = pd.Timestamp(val_cutoff).to_datetime64()
+        dates = dates.to_numpy()
+
+        # validation = >= cutoff
+        val_df = df[dates >= val_ts]
+        if not train_test_cutoff:
             # train/test = < cutoff
-            train_test_df = df[df[date_col] < val_cutoff]
+            train_test_df = df[dates < val_ts]
 
             if len(train_test_df) == 0:
                 raise CustomException("No data available for train/test before cutoff.")
@@ -75,8 +83,10 @@ def data_spliter(
                 shuffle=True,  # safe; temporal separation already enforced
             )
         else:
-            train_df = df[df[date_col] <= train_test_cutoff]
-            test_df = df[((df[date_col] > train_test_cutoff) & (df[date_col] <= val_cutoff))]
+            train_test_ts = pd.Timestamp(train_test_cutoff).to_datetime64()
+            train_mask = dates <= train_test_ts
+            train_df = df[train_mask]
+            test_df = df[~train_mask & (dates <= val_ts)]
 
         logger.info(
             f"Split complete | train={len(train_df)} | test={len(test_df)} | val={len(val_df)}"
@@ -89,6 +99,63 @@ def data_spliter(
         raise CustomException(f"Dataset split failed: {str(e)}") from e
 
 
+def optimize_dtypes(
+    df: pd.DataFrame,
+    category_columns: Sequence[str] = ("fund_cnpj",),
+    float32_columns: Sequence[str] = FLOAT32_COLUMNS,
+    date_col: str = "report_date",
+) -> pd.DataFrame:
+    """
+    Downcast the cleaned dataset to compact dtypes before splitting.
+
+    Identifier columns become categoricals (integer codes for groupby keys),
+    monetary columns become float32 and the date column is parsed once.
+    Columns that are missing from ``df`` are ignored.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Cleaned dataframe.
+    category_columns : Sequence[str], optional
+        Columns converted to ``category``.
+    float32_columns : Sequence[str], optional
+        Numeric columns converted to ``float32``.
+    date_col : str, optional
+        Name of the datetime column.
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe with the converted columns.
+
+    Raises
+    ------
+    CustomException
+        If a column cannot be converted.
+    """
+    try:
+        converted = {}
+
+        for col in category_columns:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                converted[col] = df[col].astype("category")
+
+        for col in float32_columns:
+            if col in df.columns:
+                converted[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+
+        if date_col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+            converted[date_col] = pd.to_datetime(df[date_col], format="%Y-%m-%d", cache=True)
+
+        logger.info(f"Optimized dtypes for columns: {list(converted)}")
+
+        return df.assign(**converted)
+
+    except Exception as e:
+        logger.exception("Failed to optimize dataframe dtypes.")
+        raise CustomException(f"Dtype optimization failed: {str(e)}") from e
+
+
 def save_dataframe_parquet(
     df: pd.DataFrame,
     path: str | Path,